@@ -7,19 +7,16 @@ from subsystems.drive import DriveSubsystem
 class DriveCommand(InstructionCommand):
     @staticmethod
     def validate_arguments(args: list[str]) -> bool:
+        # Validity is just "parse_arguments accepts it", so don't duplicate the checks.
         try:
-            assert len(args) >= 1 and len(args) <= 3
-            float(args[0])
-            if len(args) == 2:
-                float(args[1])
-            if len(args) == 3:
-                float(args[2])
-        except (ValueError, AssertionError):
+            DriveCommand.parse_arguments(args)
+        except (ValueError, TypeError, AssertionError):
             return False
         return True
 
     @staticmethod
     def parse_arguments(args: list[str]) -> list[Any]:
+        assert len(args) >= 1 and len(args) <= 3
         return [float(a) for a in args]
 
     @staticmethod
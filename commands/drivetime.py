@@ -40,12 +40,13 @@ class DriveTimeCommand(interpreter.InstructionCommand):
     speed: float
     timer: Timer
 
-    def __init__(self, subsystem: DriveSubsystem, duration: float, speed: float = 0.5) -> None:
+    def __init__(self, subsystem: DriveSubsystem, duration: float, speed: float = 0.5, direction: int = 1) -> None:
         super().__init__()
 
         self.drive = subsystem
         self.duration = duration
-        self.speed = speed
+        # The signed speed is computed once here so execute doesn't redo it every tick.
+        self.speed = direction * speed
         self.timer = Timer()
 
         self.addRequirements(self.drive)
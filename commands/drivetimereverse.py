@@ -1,5 +1,10 @@
 from .drivetime import DriveTimeCommand
 
+from subsystems.drive import DriveSubsystem
+
 class DriveTimeReverseCommand(DriveTimeCommand):
-    def execute(self) -> None:
-        self.drive.drive(0, -self.speed, 0)
\ No newline at end of file
+    """DriveTimeCommand, driven backward. The reversal is baked in at construction,
+    so the per-tick execute is DriveTimeCommand's own with no overriding hop.
+    """
+    def __init__(self, subsystem: DriveSubsystem, duration: float, speed: float = 0.5) -> None:
+        super().__init__(subsystem, duration, speed, direction=-1)
\ No newline at end of file
@@ -4,8 +4,10 @@ from ..exceptions import CommandSyntaxError
 from typing import Any
 
 class BooleanCondition(ConditionBase):
+    __slots__ = ()
+
     @staticmethod
-    def test(input: bool, *tokens: str) -> bool:
+    def test(input: bool, tokens: tuple) -> bool:
         if len(tokens) != 0:
             raise CommandSyntaxError("No other arguments allowed. Given: {}".format(tokens))
         return input
@@ -24,23 +26,28 @@ class BooleanCondition(ConditionBase):
         
 
 class TrueCondition(BooleanCondition):
+    __slots__ = ()
+
     @staticmethod
-    def test(input: bool, *tokens: str) -> bool:
-        return super(TrueCondition, TrueCondition).test(True, *tokens)
+    def test(input: bool, tokens: tuple) -> bool:
+        return super(TrueCondition, TrueCondition).test(True, tokens)
 
 class FalseCondition(BooleanCondition):
+    __slots__ = ()
+
     @staticmethod
-    def test(input: bool, *tokens: str) -> bool:
-        return super(FalseCondition, FalseCondition).test(False, *tokens)
+    def test(input: bool, tokens: tuple) -> bool:
+        return super(FalseCondition, FalseCondition).test(False, tokens)
 
 def register_default_boolean_conditions() -> None:
-    old_interpreter_init = InterpretCommand.__init__
-    def _register_boolean_init_(self: InterpretCommand, *args, **kwargs):
-        old_interpreter_init(self, *args, **kwargs)
-        self.register_condition("true", TrueCondition, lambda: None)
-        self.register_condition("false", FalseCondition, lambda: None)
-
-    InterpretCommand.__init__ = _register_boolean_init_
+    """Makes `true` and `false` conditions available on every InterpretCommand created
+    after this call. Calling it again is a no-op.
+    """
+    registered = {keyword for keyword, _, _ in InterpretCommand._builtin_conditions}
+    if "true" not in registered:
+        InterpretCommand._builtin_conditions.append(("true", TrueCondition, lambda: None))
+    if "false" not in registered:
+        InterpretCommand._builtin_conditions.append(("false", FalseCondition, lambda: None))
 
 
 
@@ -2,22 +2,33 @@ from ..interpreter import ConditionBase
 from ..exceptions import CommandSyntaxError
 
 from typing import Any
+import operator
+
+# Operator tokens mapped to their implementations once, rather than testing each
+# candidate per call. Conditions evaluate every scheduler tick, so `test` should
+# do as little work as possible.
+_comparison_ops = {
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+_equality_ops = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "=/=": operator.ne,
+}
 
 class NumericComparisonCondition(ConditionBase):
+    __slots__ = ()
+
     @staticmethod
-    def test(input: float, *tokens: str) -> bool:
-        op = tokens[0]
-        comparand = float(tokens[1])
-        if op == "<":
-            return input < comparand
-        elif op == ">":
-            return input > comparand
-        elif op == "<=":
-            return input <= comparand
-        elif op == ">=":
-            return input >= comparand
-        else:
-            raise CommandSyntaxError("No valid comparison found")
+    def test(input: float, tokens: tuple) -> bool:
+        # parse_arguments already resolved the operator function and comparand, so the
+        # whole per-tick evaluation is this one call on two floats.
+        return tokens[0](input, tokens[1])
     
     @staticmethod
     def validate_arguments(args: list[str]) -> bool:
@@ -31,23 +42,21 @@ class NumericComparisonCondition(ConditionBase):
     
     @staticmethod
     def parse_arguments(args: list[str]) -> list[Any]:
-        return [args[0], float(args[1])]
+        op = _comparison_ops.get(args[0])
+        if op is None:
+            raise CommandSyntaxError("No valid comparison found")
+        return [op, float(args[1])]
 
     @staticmethod
     def syntax() -> str:
         return "<cmp-op> <num>"
 
 class NumericEqualityCondition(ConditionBase):
+    __slots__ = ()
+
     @staticmethod
-    def test(input: float, *tokens: str) -> bool:
-        op = tokens[0]
-        comparand = float(tokens[1])
-        if op == "=" or op == "==":
-            return input == comparand
-        elif op == "!=" or op == "=/=":
-            return input != comparand
-        else:
-            raise CommandSyntaxError("No valid comparison found")
+    def test(input: float, tokens: tuple) -> bool:
+        return tokens[0](input, tokens[1])
     
     @staticmethod
     def validate_arguments(args: list[str]) -> bool:
@@ -61,8 +70,11 @@ class NumericEqualityCondition(ConditionBase):
     
     @staticmethod
     def parse_arguments(args: list[str]) -> list[Any]:
-        return [args[0], float(args[1])]
-    
+        op = _equality_ops.get(args[0])
+        if op is None:
+            raise CommandSyntaxError("No valid comparison found")
+        return [op, float(args[1])]
+
     @staticmethod
     def syntax() -> str:
         return "<eq-op> <num>"
\ No newline at end of file
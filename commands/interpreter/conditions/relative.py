@@ -4,12 +4,13 @@ from .numeric import NumericComparisonCondition
 
 
 class RelativeCondition(NumericComparisonCondition):
-    """A condition for measuring data against some relative point. Ideal for tests that don't care about 
+    """A condition for measuring data against some relative point. Ideal for tests that don't care about
     the start or end point - just the distance in between.
 
-    The `diff` function is set up similar to `__sub__`, that is the newest data is the LHS, and the 
+    The `diff` function is set up similar to `__sub__`, that is the newest data is the LHS, and the
     start point is RHS. In fact, for plain numeric data, `__sub__` could be the function used.
     """
+    __slots__ = ()
     
     class RelativeData:
         start: Any
@@ -1,20 +1,18 @@
 from ..interpreter import ConditionBase
 from ..exceptions import CommandSyntaxError
-from .numeric import NumericComparisonCondition, NumericEqualityCondition
+from .numeric import NumericComparisonCondition, NumericEqualityCondition, _equality_ops
 
 from typing import Any
 
 class StringEqualityCondition(ConditionBase):
+    __slots__ = ()
+
     @staticmethod
-    def test(input: str, *tokens: str) -> bool:
-        op = tokens[0]
-        comparand = tokens[1]
-        if op == "=" or op == "==":
-            return input == comparand
-        elif op == "!=" or op == "=/=":
-            return input != comparand
-        else:
-            raise CommandSyntaxError("'{}': Invalid operator".format(op))
+    def test(input: str, tokens: tuple) -> bool:
+        op = _equality_ops.get(tokens[0])
+        if op is None:
+            raise CommandSyntaxError("'{}': Invalid operator".format(tokens[0]))
+        return op(input, tokens[1])
     
     @staticmethod
     def validate_arguments(args: list[str]) -> bool:
@@ -35,12 +33,16 @@ class StringEqualityCondition(ConditionBase):
         return "<eq-op> <str>"
     
 class StringLengthComparisonCondition(NumericComparisonCondition):
+    __slots__ = ()
+
     @staticmethod
-    def test(input: str, *tokens: str) -> bool:
-        return super().test(len(input), *tokens)
+    def test(input: str, tokens: tuple) -> bool:
+        return super(StringLengthComparisonCondition, StringLengthComparisonCondition).test(len(input), tokens)
 
 class StringLengthEqualityCondition(NumericEqualityCondition):
+    __slots__ = ()
+
     @staticmethod
-    def test(input: str, *tokens: str) -> bool:
-        return super().test(len(input), *tokens)
+    def test(input: str, tokens: tuple) -> bool:
+        return super(StringLengthEqualityCondition, StringLengthEqualityCondition).test(len(input), tokens)
         
\ No newline at end of file
@@ -12,6 +12,7 @@ class TimerCondition(ConditionBase):
     `make_timer` returns a Callable that returns a singleton-like Timer, and is
     recommended when registering this class.
     """
+    __slots__ = ()
 
     class ConditionTimer:
         timer: Timer
@@ -23,8 +24,10 @@ class TimerCondition(ConditionBase):
 
 
     @staticmethod
-    def test(input: Timer, *tokens: str) -> bool:
-        time = float(tokens[0])
+    def test(input: Timer, tokens: tuple) -> bool:
+        # parse_arguments already produced the duration as a float; converting
+        # again here would run on every tick the condition is checked.
+        time = tokens[0]
         input.start()
         if input.hasElapsed(time):
             input.stop()
@@ -20,10 +20,10 @@ class DispatcherBase(commands2.Command):
     without good reason.
     """
 
-    branches: dict[str, tuple[Type[commands2.Command], list[Any]]]
+    branches: dict[str, tuple[Type[commands2.Command], list[Any], bool]]
     target: commands2.Command
 
-    default_branch: tuple[Type[commands2.Command], list[Any]]
+    default_branch: tuple[Type[commands2.Command], list[Any], bool]
 
     # Any requirements as parameters must be handled in subclasses
     def __init__(self, branch: str, *tokens: Any) -> None:
@@ -31,16 +31,25 @@ class DispatcherBase(commands2.Command):
             raise EmptyDispatchError("Dispatcher has no branches to target")
 
         if branch in self.branches:
-            klass, args = self.branches[branch]
+            klass, args, is_instruction = self.branches[branch]
         elif hasattr(self, "default_branch"):
-            klass, args = self.default_branch
+            klass, args, is_instruction = self.default_branch
             tokens = [branch] + list(tokens)
         else:
             raise DispatcherError("'{}' is not a valid dispatch target".format(branch))
-        
-        if issubclass(klass, InstructionCommand):
+
+        if is_instruction:
             tokens = klass.parse_arguments(tokens)
-        self.target = klass(*args, *tokens)
+        target = klass(*args, *tokens)
+        self.target = target
+
+        # The target's bound methods are assigned over the forwarding methods below, so
+        # each scheduler tick calls the target directly instead of paying for a trampoline
+        # frame and an extra attribute load.
+        self.initialize = target.initialize
+        self.execute = target.execute
+        self.end = target.end
+        self.isFinished = target.isFinished
 
         super().__init__()
 
@@ -48,13 +57,13 @@ class DispatcherBase(commands2.Command):
         """Call in the constructor of `DispatcherBase` subclasses to register Dispatch targets."""
         if not hasattr(self, "branches"):
             self.branches = {}
-        self.branches[key] = (command, list(args))
-    
+        self.branches[key] = (command, list(args), issubclass(command, InstructionCommand))
+
     def register_default(self, command: Type[commands2.Command], *args: Any) -> "DispatcherBase":
-        """Sets the command to be dispatched to if none of the other branches match. Useful for elegant fallback, or 
+        """Sets the command to be dispatched to if none of the other branches match. Useful for elegant fallback, or
         for setting a reasonable base behaviour.
         """
-        self.default_branch = (command, args)
+        self.default_branch = (command, args, issubclass(command, InstructionCommand))
 
     def initialize(self) -> None:
         self.target.initialize()
@@ -1,6 +1,6 @@
 import commands2 as commands
-import itertools
 import inspect
+import re
 
 from typing import Callable, Type, Any
 from dataclasses import dataclass
@@ -10,6 +10,8 @@ from .parsers import *
 
 
 class ConditionBase:
+    __slots__ = ("getter", "tokens", "invert", "continuous", "_evaluate")
+
     getter: Callable
     tokens: tuple[str]
     invert: bool
@@ -18,17 +20,28 @@ class ConditionBase:
         self.tokens = tokens
         self.invert = invert
         self.continuous = continuous
+        # The inversion is folded into the stored callable here, so evaluating the
+        # condition every tick is a single call with no branch or boolean xor.
+        test = self.test
+        if invert:
+            self._evaluate = lambda value, tokens: not test(value, tokens)
+        else:
+            self._evaluate = lambda value, tokens: bool(test(value, tokens))
 
     def _result(self) -> bool:
-        res = self.test(self.getter(), *self.tokens)
-        return bool(res) != self.invert
+        return self._evaluate(self.getter(), self.tokens)
 
     def _is_continuous(self) -> bool:
         return self.continuous
 
 
     @staticmethod
-    def test(input: Any, *tokens: str) -> bool:
+    def test(input: Any, tokens: tuple) -> bool:
+        """Evaluates the condition against the stored tokens.
+
+        Tokens are passed as the stored tuple rather than unpacked into varargs,
+        so per-evaluation calls don't re-pack an argument tuple.
+        """
         raise NotImplementedError()
     
     @staticmethod
@@ -82,7 +95,7 @@ class InstructionCommand(commands.Command):
     
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledInstruction:
     """Internal class used by InterpretCommand to represent a compiled instruction (command + condition)."""
     command: commands.Command
@@ -121,19 +134,47 @@ def _tokenize(instruction: str) -> list[str]:
     return tokens
 
 
+# Matches the first conditional keyword in an instruction, capturing it so a single
+# scan yields the command, the keyword, and the condition all at once.
+_conditional_splitter = re.compile(r" (if|unless|while|until) ")
+
+# Instruction boundaries in an unparsed program: newlines and semicolons.
+_instruction_splitter = re.compile(r"[\n;]")
+
+# Conditional keyword -> (inverted, continuous). "unless"/"until" negate the condition,
+# "while"/"until" keep testing it for as long as the command runs.
+_conditional_types = {
+    "if": (False, False),
+    "unless": (True, False),
+    "while": (False, True),
+    "until": (True, True),
+}
+
 def _split_instruction(instruction: str) -> tuple[str, tuple[str, str] | None]:
-    conditionals = ["if", "unless", "while", "until"]
-    for c in conditionals:
-        spaced = " " + c + " "
-        if spaced in instruction:
-            command, *condition = instruction.split(spaced, maxsplit=1)
-            if len(condition) == 0:
-                return command, (c, "")
-            else:
-                return command, (c, condition[0])
-    else:
+    parts = _conditional_splitter.split(instruction, maxsplit=1)
+    if len(parts) == 1:
         return instruction, None
-    
+    return parts[0], (parts[1], parts[2])
+
+
+def _split_keyword(instruction: str) -> tuple[str, list[str]]:
+    """Separates an instruction's leading keyword from its arguments.
+
+    The keyword is found with a single partition, and the remainder is only tokenized
+    when there are arguments to tokenize, so bare keywords ("fullstop", dispatch
+    targets) never pay for tokenizing or allocating an argument list.
+    """
+    key, _, rest = instruction.partition(" ")
+    if not rest:
+        return key, []
+    return key, [t for t in _tokenize(rest) if t]
+
+
+# Programs at or below this many instructions are pre-compiled during load_program.
+# Compiling a handful of instructions is cheap enough to do eagerly, and it keeps the
+# compile work off the scheduler tick entirely for typical short scripts.
+_precompile_threshold = 16
+
 
 class InterpretCommand(commands.Command):
     """A robot command that allows for modular execution of sub-commands.
@@ -160,17 +201,27 @@ class InterpretCommand(commands.Command):
     odd bugs. Whatever you're trying to accomplish can be done by registering the other commands in the group to 
     this command, then incorporating them into your program.
     """
-    instruction_set: dict[str, tuple[commands.Command, list[Any]]]
+    instruction_set: dict[str, tuple[commands.Command, list[Any], bool]]
     condition_set: dict[str, tuple[ConditionBase, Callable[[], Any]]]
     instructions: list[str]
+    _parse_cache: dict[str, tuple[tuple[str, list[str]], tuple[str, str, tuple[str, list[str]]] | None]]
 
     jit_compiled: bool
 
     step: int
-    command_sequence: list[CompiledInstruction]
+    # A list while instructions are still being JIT-cached; frozen to a tuple once the
+    # whole program has been compiled, since the sequence never changes shape after that.
+    command_sequence: list[CompiledInstruction] | tuple[CompiledInstruction, ...]
+    _active: CompiledInstruction | None
 
     errors: list[Exception]
 
+    # Conditions that every interpreter should start with. Condition modules append
+    # entries here (at import time or via their register_default_* helpers), and each
+    # new InterpretCommand registers them once in __init__. This replaces patching
+    # __init__ from outside the class, which stacked a wrapper per registration call.
+    _builtin_conditions: list[tuple[str, Type["ConditionBase"], Callable[[], Any]]] = []
+
     def __init__(self, requirements: list[commands.Subsystem] = [], parser: Callable[[list[str]], Any] = typed_parser) -> None:
         super().__init__()
 
@@ -179,6 +230,10 @@ class InterpretCommand(commands.Command):
         self.instruction_set = {}
         self.condition_set = {}
         self.instructions = []
+        self._parse_cache = {}
+
+        for keyword, condition, getter in self._builtin_conditions:
+            self.register_condition(keyword, condition, getter)
     
         self.jit_compiled = True
         self.command_sequence = []
@@ -204,18 +259,20 @@ class InterpretCommand(commands.Command):
         # classes are the expectation, but there's technically no reason to disallow Callables
         # if not isinstance(command, Type):
         #     raise TypeError("provided command must be in class form")
-        self.instruction_set[keyword] = (command, args)
-        reqs = [a for a in args if isinstance(a, commands.Subsystem)]
-        for r in reqs:
-            self.addRequirements(r)
+        # The InstructionCommand check walks the MRO, so it's done once here rather than
+        # every time the command is compiled.
+        is_instruction = inspect.isclass(command) and issubclass(command, InstructionCommand)
+        self.instruction_set[keyword] = (command, args, is_instruction)
+        if args:
+            self.addRequirements(*(a for a in args if isinstance(a, commands.Subsystem)))
 
     def summarize_commands(self) -> str:
         out = []
         for name in self.instruction_set:
-            klass, args = self.instruction_set[name]
+            klass, args, is_instruction = self.instruction_set[name]
 
             syntax = ""
-            if issubclass(klass, InstructionCommand):
+            if is_instruction:
                 syntax = klass.syntax()
             else:
                 syntax = "(builtin) {}".format(klass.__name__)
@@ -244,33 +301,48 @@ class InterpretCommand(commands.Command):
         self.condition_set[keyword] = (condition, getter)
 
     
+    def _parse_instruction(self, inst: str) -> tuple[tuple[str, list[str]], tuple[str, str, tuple[str, list[str]]] | None]:
+        """Splits and tokenizes an instruction, caching the result keyed on the source string.
+
+        Parsing an instruction is side-effect-free, and every instruction is parsed at least
+        twice (validation, then compilation) - or once per run in pure interpretation - so the
+        token lists are computed once and reused. The cache is cleared on each `load_program`.
+
+        Returns the instruction's (keyword, arguments) pair, and the condition as a
+        (conditional keyword, source, (keyword, arguments)) triple, or None if there is no
+        conditional.
+        """
+        parsed = self._parse_cache.get(inst)
+        if parsed is None:
+            instruction, condition = _split_instruction(inst)
+            if condition is not None:
+                condition = (condition[0], condition[1], _split_keyword(condition[1]))
+            parsed = (_split_keyword(instruction), condition)
+            self._parse_cache[inst] = parsed
+        return parsed
+
     def check_instruction(self, inst: str) -> None:
-        """Checks if an instruction has been registered. If it hasn't, raises an InstructionNotFoundError. 
-        
-        If the associated instruction exists, and is a subclass of ModularCommand, the arguments in the 
+        """Checks if an instruction has been registered. If it hasn't, raises an InstructionNotFoundError.
+
+        If the associated instruction exists, and is a subclass of ModularCommand, the arguments in the
         instruction will be validated, according the class' implementation of `validate_arguments`.
         """
-        instruction, condition = _split_instruction(inst)
-        if condition is not None:
-            condition = condition[1]
+        instruction, condition = self._parse_instruction(inst)
 
-        key, *tokens = _tokenize(instruction)
-        if key not in self.instruction_set:
+        key, tokens = instruction
+        registered = self.instruction_set.get(key)
+        if registered is None:
             self.errors.append(InstructionNotFoundError("'{}' is not a registered instruction".format(key)))
-
-        klass, _ = self.instruction_set[key]
-        if issubclass(klass, InstructionCommand): 
-            if not klass.validate_arguments(tokens):
-                self.errors.append(CommandSyntaxError("'{}' is not a valid argument set for '{}'".format(tokens, klass.__name__)))
+        elif registered[2] and not registered[0].validate_arguments(tokens):
+            self.errors.append(CommandSyntaxError("'{}' is not a valid argument set for '{}'".format(tokens, registered[0].__name__)))
 
         if condition is not None:
-            key, *tokens = _tokenize(condition)
-            if key not in self.condition_set:
+            key, tokens = condition[2]
+            registered = self.condition_set.get(key)
+            if registered is None:
                 self.errors.append(InstructionNotFoundError("'{}' is not a registered condition".format(key)))
-            
-            klass, _ = self.condition_set[key]
-            if not klass.validate_arguments(tokens):
-                self.errors.append(CommandSyntaxError("'{}' is not a valid argument set for '{}'".format(tokens, klass.__name__)))
+            elif not registered[0].validate_arguments(tokens):
+                self.errors.append(CommandSyntaxError("'{}' is not a valid argument set for '{}'".format(tokens, registered[0].__name__)))
     
     def load_program(self, instructions: str | list[str] | Callable[[], str | list[str]], compile: bool = False, jit: bool = True) -> None:
         """Set the program to be run, performing basic syntax checking on instructions.
@@ -286,14 +358,16 @@ class InterpretCommand(commands.Command):
         after loading the program. Note that this does reset the JIT flag internally, so if your program had JIT enabled 
         before, but you don't tell it to here, it won't be enabled. This has functionally no effect if the compile flag is set.
     
-        The `compile` flag indicates whether the program should be pre-compiled. When set to True, this is the same calling 
-        `compile` after loading the program.
+        The `compile` flag indicates whether the program should be pre-compiled. When set to True, this is the same calling
+        `compile` after loading the program. Valid programs short enough for compilation to be trivially cheap
+        are pre-compiled regardless, so they never pay compile costs on the scheduler's time.
         """
         if self.isScheduled():
             # raise ExecutionError("Can't set a new instruction set when the interpreter is running")
             self.cancel()
 
         self.errors.clear()
+        self._parse_cache.clear()
 
         if callable(instructions):
             instructions = instructions()
@@ -301,19 +375,17 @@ class InterpretCommand(commands.Command):
                 raise ValueError("instruction callable must return str or list[str]")
 
         if isinstance(instructions, str):
-            insts = [inst.split(";") for inst in instructions.split("\n")]
-            insts = itertools.chain.from_iterable(insts)
-
-            self.instructions = [i.strip() for i in insts if len(i.strip()) > 0]
+            insts = _instruction_splitter.split(instructions)
+            self.instructions = [inst for inst in (i.strip() for i in insts) if inst]
         elif isinstance(instructions, list):
             self.instructions = instructions
 
         for inst in self.instructions:
             self.check_instruction(inst)
 
-        self.command_sequence.clear()
+        self.command_sequence = []
 
-        if compile:
+        if compile or (self.current_program_valid() and len(self.instructions) <= _precompile_threshold):
             self.compile()
         self.jit_compiled = jit
 
@@ -337,40 +409,35 @@ class InterpretCommand(commands.Command):
     def _compile_instruction(self, instruction: str) -> CompiledInstruction:
         inverted = False
         continuous = False
-        inst, condition = _split_instruction(instruction)
+        inst, condition = self._parse_instruction(instruction)
         if condition is not None:
-            inverted = (condition[0] == "unless" or condition[0] == "until")
-            continuous = (condition[0] == "while" or condition[0] == "until")
-            condition = condition[1]
-        
+            inverted, continuous = _conditional_types[condition[0]]
 
         cmd = self._compile_command(inst)
 
         cond = None
-        if condition != None and len(condition) != 0:
-            if len(condition) != 0:
-                cond = self._compile_condition(condition, inverted, continuous)
+        if condition is not None:
+            if len(condition[1]) != 0:
+                cond = self._compile_condition(condition[2], inverted, continuous)
             else:
                 self.errors.append(CommandSyntaxError("Conditional does not have a condition"))
 
         return CompiledInstruction(cmd, cond)
-        
-    
-    def _compile_command(self, command: str) -> commands.Command:
-        key, *tokens = _tokenize(command) 
-        tokens = list(filter(None, tokens))
-        
-        klass, args = self.instruction_set[key]
+
+
+    def _compile_command(self, command: tuple[str, list[str]]) -> commands.Command:
+        key, tokens = command
+
+        klass, args, is_instruction = self.instruction_set[key]
         tokens = self.parser(tokens)
-        if issubclass(klass, InstructionCommand):
+        if is_instruction:
             tokens = klass.parse_arguments(tokens)
 
         return klass(*args, *tokens)
 
 
-    def _compile_condition(self, condition: str, inverted: bool, type: str) -> ConditionBase:
-        key, *tokens = _tokenize(condition)
-        tokens = list(filter(None, tokens))
+    def _compile_condition(self, condition: tuple[str, list[str]], inverted: bool, type: str) -> ConditionBase:
+        key, tokens = condition
 
         klass, f = self.condition_set[key]
         tokens = klass.parse_arguments(self.parser(tokens))
@@ -388,80 +455,99 @@ class InterpretCommand(commands.Command):
         In interpreter or JIT mode, the same work is done, but the cost is likely to be distributed 
         over human time scales, making it less significant.
         """
-        if len(self.command_sequence) != 0: 
-            self.command_sequence = []
+        if isinstance(self.command_sequence, tuple) and len(self.command_sequence) == len(self.instructions):
+            # Already fully compiled; recompiling would just rebuild the same commands.
+            return
 
+        sequence = []
         for inst in self.instructions:
-            result = self._compile_instruction(self, inst)
-            self.command_sequence.append(result)
+            sequence.append(self._compile_instruction(inst))
+        # Fully compiled programs never grow, so the sequence is frozen to a tuple for
+        # the tighter layout and cheaper indexing in the execute loop.
+        self.command_sequence = tuple(sequence)
+
+    def _next_runnable(self) -> CompiledInstruction | None:
+        """Advances past any instructions whose conditions say to skip them, and returns the
+        next instruction to run, compiling (and, in JIT mode, caching) along the way.
+        Returns None once the program is exhausted.
+
+        This is the interpreter's inner loop, running inside the scheduler tick, so it
+        leans on locals instead of repeated attribute and method lookups.
+        """
+        sequence = self.command_sequence
+        instructions = self.instructions
+        while not self.isFinished():
+            step = self.step
+            if step < len(sequence):
+                inst = sequence[step]
+            else:
+                inst = self._compile_instruction(instructions[step])
+                if self.jit_compiled:
+                    sequence.append(inst)
+            cond = inst.condition
+            if cond is None or cond._result():
+                # There isn't a condition or the condition is initially true, we proceed
+                return inst
+            # otherwise, skip the instruction
+            self.step = step + 1
+        return None
 
-    def _current_instruction(self) -> CompiledInstruction:
-        if self.step >= len(self.command_sequence):
-            return None
-        else:
-            return self.command_sequence[self.step]
-        
 
     def _advance(self) -> None:
         self.step += 1
-    
+        self._active = None
+
     def reset(self) -> None:
         """Resets the interpreter to its initial state. If the command is currently running, it is canceled.
-        
+
         If running in JIT mode, work done until the reset is cached.
         """
         if self.isScheduled():
             self.cancel()
 
         self.step = 0
+        self._active = None
 
 
     def initialize(self) -> None:
         if not self.current_program_valid():
             return
         pass
-    
+
     def execute(self) -> None:
         if not self.current_program_valid():
             return
 
-        if self._current_instruction() is None or self._current_instruction().command.isFinished():
-            # There's no command compiled at the current step or we've finished
-            while not self.isFinished():
-                if self._current_instruction() is None:
-                    cmd = self._compile_instruction(self.instructions[self.step])
-                    if self.jit_compiled:
-                        self.command_sequence.append(cmd)
-                else:
-                    cmd = self._current_instruction()
-                if not cmd.hasCondition() or cmd.condition._result():
-                    # There isn't a condition or the condition is initially true, we proceed
-                    break
-                # otherwise, skip the instruction
-                self._advance()
-            else:
+        inst = self._active
+        if inst is None or inst.command.isFinished():
+            # There's no command active at the current step or we've finished
+            inst = self._next_runnable()
+            if inst is None:
                 return
-            
-            self._current_instruction().command.initialize()
-
-
-        if self._current_instruction().hasContinuousCondition() and not self._current_instruction().condition._result():
+            self._active = inst
+            inst.command.initialize()
+
+        # This runs every 20 ms tick, so the instruction's pieces are bound to locals
+        # once rather than re-walking inst.command/inst.condition for each use.
+        cmd = inst.command
+        cond = inst.condition
+        if cond is not None and cond.continuous and not cond._result():
             # End the command and advance the pointer
-            self._current_instruction().command.end(True)
+            cmd.end(True)
             self._advance()
         else:
-            self._current_instruction().command.execute()
-            if self._current_instruction().command.isFinished():
-                self._current_instruction().command.end(False)
+            cmd.execute()
+            if cmd.isFinished():
+                cmd.end(False)
                 self._advance()
-            
-            
+
+
 
     def end(self, interrupted: bool) -> None:
         if not self.current_program_valid():
             return
-        if interrupted and self._current_instruction() != None:
-            self._current_instruction().command.cancel()
+        if interrupted and self._active is not None:
+            self._active.command.cancel()
         self.reset()
 
     def isFinished(self) -> bool:
@@ -1,7 +1,7 @@
 import wpilib
+import ntcore
 import commands2
 import commands2.button as button
-from wpilib import SmartDashboard as sd
 from wpilib import Timer
 
 from subsystems.drive import DriveSubsystem
@@ -19,14 +19,23 @@ from commands.interpreter.conditions.boolean import register_default_boolean_con
 register_default_boolean_conditions()
 
 class DriveDispatcher(DispatcherBase):
+    # The dispatch shape is fixed, so it's declared once at class scope; construction
+    # just binds the subsystem into each branch. Subclasses can override these to
+    # customize the table without re-typing registration calls.
+    _targets = (
+        ("forward", DriveTimeCommand),
+        ("reverse", DriveTimeReverseCommand),
+    )
+    _default = DriveCommand
+
     def __init__(self, subsystem: DriveSubsystem, *args):
-        self.register_target("forward", DriveTimeCommand, subsystem)
-        self.register_target("reverse", DriveTimeReverseCommand, subsystem)
-        self.register_default(DriveCommand, subsystem)
+        for keyword, command in self._targets:
+            self.register_target(keyword, command, subsystem)
+        self.register_default(self._default, subsystem)
 
         super().__init__(*args)
 
-    
+
 
 class InterpretRobot(wpilib.TimedRobot):
 
@@ -36,8 +45,13 @@ class InterpretRobot(wpilib.TimedRobot):
     def robotInit(self) -> None:
 
         self.timer = Timer()
-        self.timer.start()    
-    
+        self.timer.start()
+
+        # The scheduler singleton never changes, so grab it (and its run method) once
+        # instead of chasing it down through commands2 on every 20 ms loop.
+        self._scheduler = commands2.CommandScheduler.getInstance()
+        self._scheduler_run = self._scheduler.run
+
         self.drive_subsystem = DriveSubsystem()
         self.controller = button.CommandXboxController(0)
 
@@ -45,37 +59,52 @@ class InterpretRobot(wpilib.TimedRobot):
         self.responsive_command.register("print", commands2.PrintCommand)
         self.responsive_command.register("wait", commands2.WaitCommand)
         self.responsive_command.register("drive", DriveDispatcher, self.drive_subsystem)
-        self.responsive_command.register("time", commands2.InstantCommand, lambda: print(self.timer.get()))
+        self.responsive_command.register("time", commands2.InstantCommand, self._print_timer)
 
         self.responsive_command.register_condition("elapsed", TimerCondition, TimerCondition.make_timer())
         self.responsive_command.register_condition("angle", NumericComparisonCondition, self.drive_subsystem.angle)
 
-        self.controller.Y().onTrue(commands2.InstantCommand(lambda: self.responsive_command.load_program(self.code_box.getString(""))))
-        self.controller.start().onTrue(self.responsive_command)    
+        self.controller.Y().onTrue(commands2.InstantCommand(self._load_program))
+        self.controller.start().onTrue(self.responsive_command)
 
-        self.drive_subsystem.setDefaultCommand(commands2.RunCommand(lambda: self.drive_subsystem.drive(0,0,0), self.drive_subsystem))
+        self.drive_subsystem.setDefaultCommand(commands2.RunCommand(self.drive_subsystem.fullstop, self.drive_subsystem))
         
-        self.code_box = sd.getEntry("Interpreter Code")
-        self.updateButton = sd.getEntry("Update")
-
-        self.controller.back().onTrue(commands2.InstantCommand(lambda: self.code_box.setString(self.responsive_command.summary())))
-
+        # NT4 pub/sub handles instead of the legacy SmartDashboard entry API: subscriber
+        # reads come straight from the local value cache with no per-read type
+        # negotiation. The keys stay under /SmartDashboard so dashboards see them as
+        # before.
+        nt = ntcore.NetworkTableInstance.getDefault()
+        self._code_topic = nt.getStringTopic("/SmartDashboard/Interpreter Code")
+        self._code_sub = self._code_topic.subscribe("")
+        self._code_pub = self._code_topic.publish()
+        self._update_pub = nt.getBooleanTopic("/SmartDashboard/Update").publish()
+
+        self.controller.back().onTrue(commands2.InstantCommand(self._dump_summary))
+
+    # Button actions live as bound methods rather than closures in robotInit; the firing
+    # path is a plain method call, and the actions show up under their own names when
+    # profiling the loop.
+    def _load_program(self) -> None:
+        self.responsive_command.load_program(self._code_sub.get())
+
+    def _dump_summary(self) -> None:
+        self._code_pub.set(self.responsive_command.summary())
+
+    def _print_timer(self) -> None:
+        print(self.timer.get())
 
     def robotPeriodic(self) -> None:
         
-        # if self.updateButton.getBoolean(False):
-        #     self.updateButton.setBoolean(False)
-        #     self.instructions = self.code_box.getString("invalid")V
-        commands2.CommandScheduler.getInstance().run()
-        
+        self._scheduler_run()
+
 
 
     def autonomousPeriodic(self) -> None:
         pass
 
     def teleopInit(self) -> None:
-        self.updateButton.setBoolean(False)
-        self.code_box.setPersistent()
+        self._update_pub.set(False)
+        self._code_topic.setPersistent(True)
 
 if __name__ == "__main__":
     wpilib.run(InterpretRobot)
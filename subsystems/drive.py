@@ -20,30 +20,75 @@ class DriveSubsystem(Subsystem):
         self.front_left = rev.CANSparkMax(4, rev.CANSparkMax.MotorType.kBrushless)
         self.rear_left = rev.CANSparkMax(1, rev.CANSparkMax.MotorType.kBrushless)
         self.front_right = rev.CANSparkMax(2, rev.CANSparkMax.MotorType.kBrushless)
-        self.front_right.setInverted(True)
         self.rear_right = rev.CANSparkMax(3, rev.CANSparkMax.MotorType.kBrushless)
+
+        # Each controller is configured in one batch: back to factory defaults, apply our
+        # settings, then burn the lot to flash. Burning means a controller that browns out
+        # or reboots mid-match comes back already configured, instead of re-paying these
+        # blocking CAN round-trips. REV recommends spacing burnFlash calls out (~20 ms) so
+        # the CAN queue doesn't overflow.
+        motors = (self.front_left, self.rear_left, self.front_right, self.rear_right)
+        for motor in motors:
+            motor.restoreFactoryDefaults()
+
+        self.front_right.setInverted(True)
         self.rear_right.setInverted(True)
 
+        # Nothing here reads the SparkMax telemetry frames (velocity, position, analog),
+        # but by default each controller broadcasts them every 20-50 ms. Slowing them to
+        # 500 ms keeps 12 unused status frames from competing with drive setpoints on the
+        # CAN bus. Status 0 (applied output/faults) stays at its default rate.
+        for motor in motors:
+            motor.setPeriodicFramePeriod(rev.CANSparkMax.PeriodicFrame.kStatus1, 500)
+            motor.setPeriodicFramePeriod(rev.CANSparkMax.PeriodicFrame.kStatus2, 500)
+            motor.setPeriodicFramePeriod(rev.CANSparkMax.PeriodicFrame.kStatus3, 500)
+
+        for motor in motors:
+            motor.burnFlash()
+            wpilib.Timer.delay(0.02)
+
         self.drive_train = MecanumDrive(self.front_left, self.rear_left, self.front_right, self.rear_right)
+        # drive() and fullstop() run every scheduler tick, so their drivetrain calls go
+        # through methods bound once here instead of re-resolving them per call.
+        self._drive_cartesian = self.drive_train.driveCartesian
+        self._stop = self.drive_train.stopMotor
+        self._feed = self.drive_train.feed
+        self._stopped = False
 
         self.gyro = NavxGyro(wpilib.SPI.Port.kMXP)
-    
+        self._cached_angle = self.gyro.getAngle()
+
         super().__init__()
+
+    def periodic(self) -> None:
+        # The scheduler runs this once per loop, before any commands. Sampling the gyro
+        # here means conditions can read the angle as often as they like without crossing
+        # into the NavX driver each time - and they all see the same value within a tick.
+        self._cached_angle = self.gyro.getAngle()
     
-    def drive(self, x_speed: int, y_speed: int, rot: int) -> None:
-        # Here we are invoking the MecanumDrive's own drive method, since we don't need to 
+    def drive(self, x_speed: float, y_speed: float, rot: float) -> None:
+        # Here we are invoking the MecanumDrive's own drive method, since we don't need to
         # reinvent the wheel.
-        self.drive_train.driveCartesian(y_speed, x_speed, rot)
+        self._drive_cartesian(y_speed, x_speed, rot)
+        if x_speed != 0 or y_speed != 0 or rot != 0:
+            self._stopped = False
 
     def fullstop(self) -> None:
-        # This completely stops all motion on the robot, which is useful, since without 
+        # This completely stops all motion on the robot, which is useful, since without
         # telling it to stop, the robot will just keep driving.
-        self.drive_train.stopMotor()
+        # Stopping is idempotent, so once stopped we just feed the motor-safety watchdog
+        # instead of re-sending four zeroed setpoints over CAN every loop.
+        if self._stopped:
+            self._feed()
+            return
+        self._stop()
+        self._stopped = True
 
     def angle(self) -> float:
-        # Get the Yaw angle from the gyro (rotation around Z-axis).
-        return self.gyro.getAngle()
+        # The Yaw angle from the gyro (rotation around Z-axis), as of this scheduler tick.
+        return self._cached_angle
 
     def reset(self) -> None:
         # Set the gyro's current angle to zero.
         self.gyro.zeroYaw()
+        self._cached_angle = self.gyro.getAngle()